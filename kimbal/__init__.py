@@ -17,15 +17,30 @@ Structure of kimbal
     └─ workcal
 """
 
+from importlib import import_module as _import_module
+
 # Make version available in python console
 from ._version import __version__
 
-# Import kimbal modules
-from kimbal import loader
+# Import logging module and variables
 from kimbal import colourlog
-from kimbal import workcal
-
-# Import classes and logging variables
-from .main import Kimai
 from .colourlog import CustomFormatter, logger, ch
-from .loader import Period
+
+# Import modules and classes depending on pandas only when they are first used
+_LAZY_MODULES = ("loader", "workcal", "main")
+_LAZY_OBJECTS = {"Kimai": "main", "Period": "loader"}
+
+# Define public names for star-imports (lazy names are resolved by __getattr__)
+__all__ = ["CustomFormatter", "Kimai", "Period", "ch", "colourlog", "loader", "logger", "main", "workcal"]
+
+
+def __getattr__(name):
+    if name in _LAZY_MODULES:
+        return _import_module("." + name, __name__)
+    elif name in _LAZY_OBJECTS:
+        return getattr(_import_module("." + _LAZY_OBJECTS[name], __name__), name)
+    raise AttributeError("module {m!r} has no attribute {a!r}".format(m=__name__, a=name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODULES) | set(_LAZY_OBJECTS))
@@ -34,10 +34,11 @@ class CustomFormatter(logging.Formatter):
         logging.CRITICAL: crt + format + reset
     }
 
+    FORMATTERS = {level: logging.Formatter(fmt) for level, fmt in FORMATS.items()}
+
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt)
-        return formatter.format(record)
+        formatter = self.FORMATTERS.get(record.levelno)
+        return formatter.format(record) if formatter else super().format(record)
 
 
 logger = logging.getLogger("Kimai")
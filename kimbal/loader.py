@@ -20,13 +20,50 @@ Period = namedtuple("Period", ["start", "end"],
                     defaults=[dt.date(1900, 1, 1), dt.date(2100, 1, 1)])
 
 
+class ReadOnly:
+    """
+    Read-only attribute of kimbal classes.
+
+    The value is read from the private attribute of the same name in the owner class,
+    i.e. `workdays = ReadOnly()` in class `Kimai` returns `self.__workdays`.
+    Used as decorator, the decorated method computes the value on first access,
+    which is then stored in the private attribute and reused.
+    Attempts to change or delete the attribute are rejected with a warning.
+    """
+
+    def __init__(self, fget=None, doc=None):
+        self.__fget = fget
+        self.__doc__ = doc if fget is None else fget.__doc__
+
+    def __set_name__(self, owner, name):
+        self.__attr = "_" + owner.__name__.lstrip("_") + "__" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.__attr)
+        except AttributeError:
+            if self.__fget is None:
+                raise
+        value = self.__fget(obj)
+        setattr(obj, self.__attr, value)
+        return value
+
+    def __set__(self, obj, value):
+        logger.warning("Kimai values cannot be changed.")
+
+    def __delete__(self, obj):
+        logger.warning("Kimai attributes cannot be deleted.")
+
+
 class TimeFrame:
     """ Defines the period of the Kimai data."""
 
     def __init__(self,
-                 year=dt.datetime.now().year,
+                 year=None,
                  period=Period()):
-        self.__year = year
+        self.__year = dt.datetime.now().year if year is None else year
         self.__period = period
 
     def __repr__(self):
@@ -36,17 +73,8 @@ class TimeFrame:
         return "TimeLog(\"" + self.__file + "\", " + str(self.__period.start) + \
             ":" + str(self.__period.end) + ")"
 
-    def __setter(self, value):
-        logger.warning("Kimai values cannot be changed.")
-
-    def __deleter(self):
-        logger.warning("Kimai attributes cannot be deleted.")
-
-    def __get_year(self): return self.__year
-    year = property(__get_year, __setter, __deleter)
-
-    def __get_period(self): return self.__period
-    period = property(__get_period, __setter, __deleter)
+    year = ReadOnly(doc="Year of the Kimai data")
+    period = ReadOnly(doc="Period with start and end date of the Kimai data")
 
 
 class TimeLog(TimeFrame):
@@ -55,10 +83,10 @@ class TimeLog(TimeFrame):
     def __init__(self,
                  file="export.csv",
                  dir=os.getcwd(),
-                 year=dt.datetime.now().year
+                 year=None
                  ):
         # Read data file with exported Kimai times and convert time strins to datetimes
-        self.__year = year
+        self.__year = dt.datetime.now().year if year is None else year
         rawdata = self._read_kimai(file, dir)
         self._convert_times(rawdata)
         super().__init__(self.__year, self.__period)
@@ -80,15 +108,15 @@ class TimeLog(TimeFrame):
 
         try:
             self.__file = filepath(file, dir)
-        except FileNotFoundError:
-            logger.error(
-                "Data file with Kimai time log ('{f}') not found.".format(f=filepath(file, dir, always_return=True)))
+        except FileNotFoundError as err:
+            logger.error("Data file with Kimai time log ('{f}') not found.".format(f=err.filename))
             exit(44)
         else:
-            return pd.read_csv(
+            return read_csv(
                 self.__file,
                 header=0,
-                usecols=["Date", "In", "Out", "h:m", "Time"]
+                usecols=["Date", "In", "Out"],
+                dtype={"Date": "string", "In": "string", "Out": "string"}
             )
 
     def _convert_times(self, df):
@@ -99,37 +127,31 @@ class TimeLog(TimeFrame):
         :return: dataframe with postprocessed times and periods
         """
 
-        # Convert time strings in raw data to datetimes
-        start = pd.to_datetime(df.Date + str(self.__year) +
-                               " " + df.In, dayfirst=True)
-        end = pd.to_datetime(df.Date + str(self.__year) + " " + df.Out, dayfirst=True)
+        # Split date (dd.mm.) and time (HH:MM or HH:MM:SS) strings in raw data into numbers;
+        # empty fields of open entries become NaN and result in NaT
+        date = df.Date.str.split(".", expand=True).reindex(columns=[0, 1]).astype(float)
+        tin = df.In.str.split(":", expand=True).reindex(columns=[0, 1]).astype(float)
+        tout = df.Out.str.split(":", expand=True).reindex(columns=[0, 1]).astype(float)
+
+        # Assemble datetimes from date and time components
+        date = {"year": self.__year, "month": date[1], "day": date[0]}
+        start = pd.to_datetime({**date, "hour": tin[0], "minute": tin[1]})
+        end = pd.to_datetime({**date, "hour": tout[0], "minute": tout[1]})
 
         # Extract time period covered in data file
         self.__period = Period(start.iloc[-1].date(), end.iloc[0].date())
 
         # Correct dates for work periods over midnight
-        for i in range(len(end)):
-            if start[i] > end[i]:
-                end[i] += dt.timedelta(days=1)
+        end += pd.to_timedelta((start.to_numpy() > end.to_numpy()).astype(int), unit="D")
 
-        self.__kimai_data = pd.DataFrame({
+        self.__data = pd.DataFrame({
             'start': start,
             'end': end,
-            'duration': end - start,
-            'hours': df.Time
+            'duration': end - start
         })
 
-    def __setter(self, value):
-        logger.warning("Kimai values cannot be changed.")
-
-    def __deleter(self):
-        logger.warning("Kimai attributes cannot be deleted.")
-
-    def __get_file(self): return self.__file
-    file = property(__get_file, __setter, __deleter)
-
-    def __get_data(self): return self.__kimai_data
-    data = property(__get_data, __setter, __deleter)
+    file = ReadOnly(doc="Kimai data file (including the directory)")
+    data = ReadOnly(doc="Dataframe with start and end times and durations of the Kimai time log")
 
 
 def filepath(filename, dir='.', always_return=False):
@@ -149,7 +171,7 @@ def filepath(filename, dir='.', always_return=False):
     str
         Join directory and file name.
     """
-    file = filename if ('/' in filename) else os.path.join(dir, filename)
+    file = filename if os.path.dirname(filename) else os.path.join(dir, filename)
     if always_return or os.path.exists(file):
         return file
     else:
@@ -157,11 +179,39 @@ def filepath(filename, dir='.', always_return=False):
             errno.ENOENT, os.strerror(errno.ENOENT), file)
 
 
+def read_csv(file, **kwargs):
+    """Reads a csv file into a pandas dataframe using the pyarrow engine, if available.
+
+    Parameters
+    ----------
+    file : str
+        File name including the path.
+    **kwargs
+        Further keyword arguments passed to pandas.read_csv.
+
+    Returns
+    -------
+    pandas.DataFrame
+        File data. If pyarrow is not installed, the default C engine is used.
+
+    Notes
+    -----
+    Depending on the engine, dtype only casts the parsed columns and does not prevent type inference.
+    The pyarrow engine still infers times such as '08:00' as time columns, which are cast back to
+    strings as '08:00:00', whereas the C engine keeps the text of the file. Callers must not rely on
+    the textual format of time columns.
+    """
+    try:
+        return pd.read_csv(file, engine="pyarrow", **kwargs)
+    except ImportError:
+        return pd.read_csv(file, low_memory=False, **kwargs)
+
+
 if __name__ == "__main__":
     tl = TimeLog()
     print(tl.data)
     print(tl.period)
-    print(tl.kimai_file)
+    print(tl.file)
     tf = TimeFrame()
     print(tf.year)
     print(tf.period)
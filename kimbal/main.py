@@ -8,13 +8,40 @@ the balance
 
 # Import packages and modules
 import os
-import pandas as pd
 import datetime as dt
 from textwrap import dedent
-from kimbal.loader import TimeLog, Period
+from kimbal.loader import TimeLog, ReadOnly
 from kimbal.workcal import OffDays, work_days
 from kimbal.colourlog import logger, ch
 
+# Define length of a work day in hours and seconds
+_HOURS_PER_WDAY = 8
+_SECS_PER_WDAY = _HOURS_PER_WDAY*3600
+
+# Define template for Kimai statistics
+_STATS_TEMPLATE = dedent("""
+    Kimai Statistics for {sd} - {ed}
+    ============================================
+
+    Work and off-days
+    -----------------
+    - Working days: {wd}
+    - Weekend days: {we}
+    - Holidays: {hd}
+    - Annual leave: {al}
+
+    Balance account
+    ---------------
+    - Working hours (demand): {dt} ({dh:.2f})
+    - Hours worked: {wt} ({wh:.2f})
+    - Balance: {bt} ({bh:.2f})
+
+    Data files
+    ----------
+    - Kimai data: {kf}
+    - Vacation:   {vf}
+""")
+
 
 class Kimai(TimeLog):
     """Store and analyse Kimai TimeLog data within a TimeFrame."""
@@ -22,14 +49,13 @@ class Kimai(TimeLog):
     def __init__(self,
                  file="export.csv",
                  dir=os.getcwd(),
-                 year=dt.datetime.now().year,
+                 year=None,
                  vacation="vacation.csv"):
         # Read data file with exported Kimai times and convert time strins to datetimes
         super().__init__(file, dir, year)
-        # Count working and off-days
-        self.__vacation = OffDays(vacation, dir, self.year, self.period)
-        self.__working_hours()
-        self.__compile_hours()
+        # Save off-days source; working and off-days are counted on first access
+        self.__offsource = vacation
+        self.__dir = dir
 
     def __repr__(self):
         return "Kimai(\"" + self.__file + "\", " + str(self.year) + ")"
@@ -50,34 +76,13 @@ class Kimai(TimeLog):
         None.
         """
 
-        print(dedent("""
-                     Kimai Statistics for {sd} - {ed}
-                     ============================================
-
-                     Work and off-days
-                     -----------------
-                     - Working days: {wd}
-                     - Weekend days: {we}
-                     - Holidays: {hd}
-                     - Annual leave: {al}
-
-                     Balance account
-                     ---------------
-                     - Working hours (demand): {dt} ({dh:.2f})
-                     - Hours worked: {wt} ({wh:.2f})
-                     - Balance: {bt} ({bh:.2f})
-
-                     Data files
-                     ----------
-                     - Kimai data: {kf}
-                     - Vacation:   {vf}
-                     """.format(sd=str(self.period.start), ed=self.period.end,
-                     wd=self.workdays, we=self.weekenddays,
-                     hd=self.holidays, al=self.vacation.days,
-                     dt=self.__format_timedelta(self.workingtimes), dh=self.workinghours,
-                     wt=self.__format_timedelta(self.workedtimes), wh=self.workedhours,
-                     bt=self.__format_timedelta(self.timedifference),
-                     bh=self.balance, kf=self.file, vf=self.vacation.file)))
+        print(_STATS_TEMPLATE.format(sd=self.period.start, ed=self.period.end,
+                                     wd=self.workdays, we=self.weekenddays,
+                                     hd=self.holidays, al=self.vacation.days,
+                                     dt=self.__format_timedelta(self.workingtimes), dh=self.workinghours,
+                                     wt=self.__format_timedelta(self.workedtimes), wh=self.workedhours,
+                                     bt=self.__format_timedelta(self.timedifference),
+                                     bh=self.balance, kf=self.file, vf=self.vacation.file))
 
     def __working_hours(self):
         """
@@ -92,11 +97,11 @@ class Kimai(TimeLog):
         -------
         None.
         """
-        wdays, wends, hdays = work_days(*self.period, self.year, vacation=self.__vacation.days)
+        wdays, wends, hdays = work_days(*self.period, self.year, vacation=self.vacation.days)
         self.__workdays = wdays
         self.__weekenddays = wends
         self.__holidays = hdays
-        self.__workinghours = 8*wdays
+        self.__workinghours = _HOURS_PER_WDAY*wdays
         self.__workingtimes = dt.timedelta(hours=self.__workinghours)
 
     def __compile_hours(self):
@@ -112,15 +117,15 @@ class Kimai(TimeLog):
         None.
         """
         # Define working times
-        self.__workedtimes = sum(self.data.duration, dt.timedelta())
-        self.__workedhours = sum(self.data.hours)
+        self.__workedtimes = self.data.duration.sum()
+        self.__workedhours = self.__workedtimes.total_seconds()/3600
         # Calculate balance
-        self.__balance = self.__workedhours - self.__workinghours
-        self.__timedifference = self.__workedtimes - self.__workingtimes
+        self.__balance = self.__workedhours - self.workinghours
+        self.__timedifference = self.__workedtimes - self.workingtimes
 
     def __format_timedelta(self, td):
         """
-        Counts the hours worked as time and float and calculates the respective balances.
+        Formats a time difference in work days and hours, minutes, and seconds.
 
         Parameters
         ----------
@@ -132,61 +137,74 @@ class Kimai(TimeLog):
         Formatted timedelta string, where timedeltas are displayed as ±|timedelta|.
         1 day counts as 8 hours (1 work day).
         """
-        # Define sign of timedelta and remove it from timedelta
-        sign = "-" if td < dt.timedelta(0) else "+"
-        if td < dt.timedelta(0): td *= -1
-        # Add every 8 hours in seconds to days
-        adday, seconds = divmod(td.seconds, 8*3600)
-        # Transform days int work days (8h periods)
-        wdays = 3*td.days + adday
+        # Define sign of timedelta and split its absolute value into work days (8h periods) and seconds
+        seconds = int(td.total_seconds())
+        sign = "-" if seconds < 0 else "+"
+        wdays, seconds = divmod(abs(seconds), _SECS_PER_WDAY)
+        hours, seconds = divmod(seconds, 3600)
+        minutes, seconds = divmod(seconds, 60)
         # Return formatted string
-        return sign + str(dt.timedelta(wdays, seconds))
-
-    def __setter(self, value):
-        logger.warning("Kimai values cannot be changed.")
-
-    def __deleter(self):
-        logger.warning("Kimai attributes cannot be deleted.")
+        days = "{:d} day{}, ".format(wdays, "" if wdays == 1 else "s") if wdays else ""
+        return "{}{}{:d}:{:02d}:{:02d}".format(sign, days, hours, minutes, seconds)
 
-    def __get_workdays(self): return self.__workdays
-    workdays = property(__get_workdays, __setter, __deleter,
-                        "Number of work days within the period")
+    @ReadOnly
+    def vacation(self):
+        """Offdays object with number of vacation days within the period and the data source file"""
+        return OffDays(self.__offsource, self.__dir, self.year, self.period)
 
-    def __get_weekenddays(self): return self.__weekenddays
-    weekenddays = property(__get_weekenddays, __setter, __deleter,
-                           "Number of weekend days within the period")
+    @ReadOnly
+    def workdays(self):
+        """Number of work days within the period"""
+        self.__working_hours()
+        return self.__workdays
 
-    def __get_holidays(self): return self.__holidays
-    holidays = property(__get_holidays, __setter, __deleter,
-                        "Number of holidays within the period")
+    @ReadOnly
+    def weekenddays(self):
+        """Number of weekend days within the period"""
+        self.__working_hours()
+        return self.__weekenddays
 
-    def __get_vacation(self): return self.__vacation
-    vacation = property(__get_vacation, __setter, __deleter,
-                        "Offdays object with number of vacation days within the period and the data source file")
+    @ReadOnly
+    def holidays(self):
+        """Number of holidays within the period"""
+        self.__working_hours()
+        return self.__holidays
 
-    def __get_workinghours(self): return self.__workinghours
-    workinghours = property(__get_workinghours, __setter, __deleter,
-                            "Hours needed (debit) displayed as float")
+    @ReadOnly
+    def workinghours(self):
+        """Hours needed (debit) displayed as float"""
+        self.__working_hours()
+        return self.__workinghours
 
-    def __get_workingtimes(self): return self.__workingtimes
-    workingtimes = property(__get_workingtimes, __setter, __deleter,
-                            "Work time needed (debit) displayed as working days (8h) and hours, minutes, and seconds")
+    @ReadOnly
+    def workingtimes(self):
+        """Work time needed (debit) displayed as working days (8h) and hours, minutes, and seconds"""
+        self.__working_hours()
+        return self.__workingtimes
 
-    def __get_workedhours(self): return self.__workedhours
-    workedhours = property(__get_workedhours, __setter, __deleter,
-                           "Work hours performed (credit) displayed as float")
+    @ReadOnly
+    def workedhours(self):
+        """Work hours performed (credit) displayed as float"""
+        self.__compile_hours()
+        return self.__workedhours
 
-    def __get_workedtimes(self): return self.__workedtimes
-    workedtimes = property(__get_workedtimes, __setter, __deleter,
-                           "Work hours performed (credit) displayed as working days (8h) and hours, minutes, and seconds")
+    @ReadOnly
+    def workedtimes(self):
+        """Work hours performed (credit) displayed as working days (8h) and hours, minutes, and seconds"""
+        self.__compile_hours()
+        return self.__workedtimes
 
-    def __get_balance(self): return self.__balance
-    balance = property(__get_balance, __setter, __deleter,
-                       "Balance of work account (Hours needed (debit) - work hours performed (credit)) in hours as float")
+    @ReadOnly
+    def balance(self):
+        """Balance of work account (Hours needed (debit) - work hours performed (credit)) in hours as float"""
+        self.__compile_hours()
+        return self.__balance
 
-    def __get_timedifference(self): return self.__timedifference
-    timedifference = property(__get_timedifference, __setter, __deleter,
-                              "Balance of work account (Hours needed (debit) - work hours performed (credit)) in working days and time")
+    @ReadOnly
+    def timedifference(self):
+        """Balance of work account (Hours needed (debit) - work hours performed (credit)) in working days and time"""
+        self.__compile_hours()
+        return self.__timedifference
 
 
 if __name__ == '__main__':
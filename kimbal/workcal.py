@@ -9,9 +9,8 @@ holidays as well as annual and sick leave.
 # Import python packages
 import os
 import pandas as pd
-import datetime as dt
-import holidays
-from kimbal.loader import TimeFrame, Period, filepath
+from functools import lru_cache
+from kimbal.loader import TimeFrame, Period, ReadOnly, filepath, read_csv
 from kimbal.colourlog import logger
 
 
@@ -21,31 +20,22 @@ class OffDays(TimeFrame):
     def __init__(self,
                  off="vacation.csv",
                  dir=os.getcwd(),
-                 year=dt.datetime.now().year,
+                 year=None,
                  period=Period()
                  ):
         # Count working and off-days
         super().__init__(year, period)
-        self.__vacdays, self.__vacfile = off_days(
+        self.__days, self.__file = off_days(
             self.year, off, dir, self.period)
 
     def __repr__(self):
-        return "OffDays(\"" + self.__vacfile + "\", " + str(self.year) + ")"
+        return "OffDays(\"" + self.__file + "\", " + str(self.year) + ")"
 
     def __str__(self):
         return "OffDays(" + str(self.period.start) + ":" + str(self.period.end) + ")"
 
-    def __setter(self, value):
-        logger.warning("Kimai values cannot be changed.")
-
-    def __deleter(self):
-        logger.warning("Kimai attributes cannot be deleted.")
-
-    def __get_days(self): return self.__vacdays
-    days = property(__get_days, __setter, __deleter, "Number of off-days within the period")
-
-    def __get_file(self): return self.__vacfile
-    file = property(__get_file, __setter, __deleter, "Data source file (including the directory)")
+    days = ReadOnly(doc="Number of off-days within the period")
+    file = ReadOnly(doc="Data source file (including the directory)")
 
 
 def off_days(year, off, dir='.', restrict=Period()):
@@ -60,7 +50,8 @@ def off_days(year, off, dir='.', restrict=Period()):
     Parameters
     ----------
     year : int
-        The year holding the period. The period must not extend over several years.
+        Ignored; holidays in off periods are taken from all years covered by each period.
+        Kept for compatibility and passed on to work_days.
     off : int or str
         Either number of off-days or file name of data source file (in- or excluding the directory)
     dir : str, optional (otherwise current directory)
@@ -82,20 +73,19 @@ def off_days(year, off, dir='.', restrict=Period()):
     # Or read data from file
     try:
         off_file = filepath(off, dir)
-    except FileNotFoundError:
-        logger.warning("File '{f}' not found. Off-days set to 0.".format(
-            f=filepath(off, dir, always_return=True)))
+    except FileNotFoundError as err:
+        logger.warning("File '{f}' not found. Off-days set to 0.".format(f=err.filename))
         return 0, None
-    # Count off days in data file
-    offdays = 0
-    offdata = pd.read_csv(off_file, header=0)
-    for index, data in offdata.iterrows():
-        dates = pd.to_datetime(data.date.split('-'), dayfirst=True)
-        if len(dates) == 1:
-            if dates[0] in pd.date_range(*restrict):
-                offdays += 1
-        else:
-            offdays += work_days(*dates, year, restrict=restrict)[0]
+    # Split off-dates into start and end dates (end is NaT for single off-dates)
+    offdata = read_csv(off_file, header=0, usecols=['date'], dtype={'date': 'string'})
+    dates = offdata.date.str.replace(' ', '').str.split('-', n=1, expand=True).reindex(columns=[0, 1])
+    start = pd.to_datetime(dates[0], format='%d.%m.%Y')
+    end = pd.to_datetime(dates[1], format='%d.%m.%Y')
+    # Count single off-dates within the restrict period and work days in off periods
+    single = end.isna()
+    offdays = int(start[single].between(pd.Timestamp(restrict.start), pd.Timestamp(restrict.end)).sum())
+    for first, last in zip(start[~single], end[~single]):
+        offdays += work_days(first, last, year, restrict=restrict)[0]
     return offdays, off_file
 
 
@@ -103,7 +93,7 @@ def work_days(start, end, year, vacation=0, restrict=Period()):
     """
     Counts the number of work days, weekend days, and holidays in a period.
 
-    Give statistics on the number of work days and weekends or holidays between the start and end date in a given year.
+    Give statistics on the number of work days and weekends or holidays between the start and end date.
     The number of vacation days is substracted from the work days and a second period (restrict) can be passed to
     work_days. In this case only the intersect between the period and the range between start and end is considered.
 
@@ -114,7 +104,7 @@ def work_days(start, end, year, vacation=0, restrict=Period()):
     end : datetime.date
         End of the period in which the work and off days are counted.
     year : int
-        The year holding the period between start and end. The period must not extend over several years.
+        Ignored; holidays are taken from all years covered by the period. Kept for compatibility.
     vacation : int
         Number of vacation days substracted from the work days.
     restrict : Period, optional
@@ -130,22 +120,49 @@ def work_days(start, end, year, vacation=0, restrict=Period()):
         Number of weekend days in the period (or intersect of periods)
     hdays : int
         Number of holidays in the period (or intersect of periods) determined by the holidays package for Saxony, Germany.
+        Holidays are taken from all years covered by the period.
     """
 
-    offdays = holidays.Germany(prov='SN', years=[year])
-    wdays, wends, hdays = -vacation, 0, 0
-    drange = pd.date_range(start, end).intersection(
-        pd.date_range(restrict.start, restrict.end))
-    for day in drange:
-        if day in offdays:
-            hdays += 1
-        elif day.weekday() >= 5:
-            wends += 1
-        else:
-            wdays += 1
+    # Build date range of the intersect of both periods
+    drange = pd.date_range(max(pd.Timestamp(start), pd.Timestamp(restrict.start)),
+                           min(pd.Timestamp(end), pd.Timestamp(restrict.end)))
+    # Combine holidays of all years covered by the date range
+    offdays = pd.DatetimeIndex([]).append([holiday_dates(y) for y in drange.year.unique()])
+    # Classify days as holidays, weekend days (that are no holidays), and work days
+    is_holiday = drange.isin(offdays)
+    is_weekend = drange.weekday >= 5
+    hdays = int(is_holiday.sum())
+    wends = int((is_weekend & ~is_holiday).sum())
+    wdays = len(drange) - hdays - wends - vacation
     return wdays, wends, hdays
 
 
+@lru_cache(maxsize=None)
+def holiday_dates(year, prov='SN'):
+    """
+    Returns the public holidays of a German state in a single year.
+
+    Results are cached, so the holidays calendar is only built once per year and state.
+    Unlike a holidays.Germany object, the returned dates are not expanded to other years on lookup;
+    callers covering several years must combine the results for each year (as done in work_days).
+
+    Parameters
+    ----------
+    year : int
+        The year of the holidays.
+    prov : str, optional
+        Abbreviation of the German state; default is Saxony.
+
+    Returns
+    -------
+    pandas.DatetimeIndex
+        Dates of the holidays determined by the holidays package.
+    """
+    # Import holidays package only when the first calendar is needed
+    import holidays
+    return pd.to_datetime(list(holidays.Germany(prov=prov, years=[year])))
+
+
 if __name__ == "__main__":
     datadir = "../data"
 
@@ -11,11 +11,12 @@ PKGNAME = 'kimbal'
 # Read version from file in _version.py
 VERSIONFILE= path.join(PKGNAME, "_version.py")
 print(VERSIONFILE)
-verstrline = open(VERSIONFILE, "rt").read()
 try:
-    verstrline = open(VERSIONFILE, "rt").read()
+    with open(VERSIONFILE, "rt") as f:
+        verstrline = f.read()
 except FileNotFoundError:
     print("\x1b[31;20mError: Version file not found. Version must be stored in {pkg}/_version.py.\x1b[0m".format(pkg=PKGNAME))
+    sys.exit(1)
 
 VSRE = r"^__version__ = ['\']([^'\']*)['\"]"
 mo = re.search(VSRE, verstrline, re.M)
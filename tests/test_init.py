@@ -0,0 +1,8 @@
+"""Tests for the public names of the kimbal package."""
+
+
+def test_star_import_exports_public_names():
+    namespace = {}
+    exec("from kimbal import *", namespace)
+    assert sorted(name for name in namespace if name != "__builtins__") == [
+        "CustomFormatter", "Kimai", "Period", "ch", "colourlog", "loader", "logger", "main", "workcal"]
@@ -0,0 +1,29 @@
+"""Tests for loading Kimai time logs in kimbal.loader."""
+
+import pandas as pd
+from kimbal.loader import TimeLog
+
+
+def write_export(path, rows):
+    (path / "export.csv").write_text("Date,In,Out,h:m,Time\n" + "\n".join(rows) + "\n")
+
+
+def test_midnight_rollover(tmp_path):
+    write_export(tmp_path, ["05.01.,22:00,02:30,4:30,4.5", "04.01.,08:00,16:45,8:45,8.75"])
+    data = TimeLog("export.csv", str(tmp_path), 2022).data
+    assert data.end[0] == pd.Timestamp(2022, 1, 6, 2, 30)
+    assert list(data.duration) == [pd.Timedelta(hours=4, minutes=30), pd.Timedelta(hours=8, minutes=45)]
+
+
+def test_open_entry_without_end_time(tmp_path):
+    write_export(tmp_path, ["05.01.,22:00,,,", "04.01.,08:00,16:45,8:45,8.75"])
+    tl = TimeLog("export.csv", str(tmp_path), 2022)
+    assert tl.data.start[0] == pd.Timestamp(2022, 1, 5, 22)
+    assert pd.isna(tl.data.end[0]) and pd.isna(tl.data.duration[0])
+    assert tl.data.duration[1] == pd.Timedelta(hours=8, minutes=45)
+    assert tl.period.start == pd.Timestamp(2022, 1, 4).date()
+
+
+def test_all_entries_open(tmp_path):
+    write_export(tmp_path, ["05.01.,22:00,,,", "04.01.,08:00,,,"])
+    assert TimeLog("export.csv", str(tmp_path), 2022).data.end.isna().all()
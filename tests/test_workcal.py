@@ -0,0 +1,17 @@
+"""Tests for counting work, weekend, holidays, and off-days in kimbal.workcal."""
+
+import datetime as dt
+from kimbal.workcal import work_days, off_days
+
+
+def test_work_days_across_new_year():
+    # 20.12.2022 - 05.01.2023: holidays on 25.12. (Sun), 26.12. (Mon), and 01.01. (Sun)
+    assert work_days(dt.date(2022, 12, 20), dt.date(2023, 1, 5), 2023) == (12, 2, 3)
+    assert work_days(dt.date(2022, 12, 20), dt.date(2023, 1, 5), 2022) == (12, 2, 3)
+
+
+def test_off_days_period_across_new_year(tmp_path):
+    (tmp_path / "vacation.csv").write_text("date,reason\n20.12.2022-05.01.2023,holiday\n")
+    offdays, file = off_days(2023, "vacation.csv", str(tmp_path))
+    assert offdays == 12
+    assert file == str(tmp_path / "vacation.csv")